@@ -0,0 +1,125 @@
+"""Benchmarks the point of interest mobility model against the implementation it replaced.
+
+Usage:
+    python benchmarks/point_of_interest_mobility.py [NUMBER_OF_USERS ...]
+
+Each run creates the given number of users walking towards randomly chosen points of interest, moves them for a number of
+time steps as 'User.step()' does (only users without a known future position are moved) and reports the time spent per
+user per time step.
+"""
+
+# Python libraries
+import math
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+# EdgeSimPy components
+from edge_sim_py.components import PointOfInterest, User
+from edge_sim_py.components.mobility_models import point_of_interest_mobility
+
+NUMBER_OF_POINTS_OF_INTEREST = 20
+NUMBER_OF_STEPS = 50
+GRID_SIZE = 1000
+
+
+def baseline_point_of_interest_mobility(user: User):
+    """Point of interest mobility model as implemented before the per-user model was optimized.
+
+    Args:
+        user (User): User whose mobility will be defined.
+    """
+    if user.point_of_interest is None:
+        return
+
+    (x1, y1) = user.coordinates_trace[-1]
+    (x2, y2) = user.point_of_interest.coordinates
+    total_distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+    if total_distance <= user.movement_distance:
+        user.coordinates_trace.append((x2, y2))
+        user.coordinates = (x2, y2)
+        return
+
+    ratio = user.movement_distance / total_distance
+    x3 = x1 + (x2 - x1) * ratio
+    y3 = y1 + (y2 - y1) * ratio
+    user.coordinates_trace.append((x3, y3))
+    user.coordinates = (x3, y3)
+
+
+def create_users(number_of_users: int, model: SimpleNamespace) -> list:
+    """Creates users walking towards randomly chosen points of interest.
+
+    Args:
+        number_of_users (int): Number of users to create.
+        model (SimpleNamespace): Stand-in for the simulation model, holding the current time step.
+
+    Returns:
+        list: Created users.
+    """
+    random.seed(1)
+    for component in [User, PointOfInterest]:
+        component._instances = []
+        component._object_count = 0
+
+    points_of_interest = []
+    for _ in range(NUMBER_OF_POINTS_OF_INTEREST):
+        point_of_interest = PointOfInterest()
+        point_of_interest.coordinates = (random.randint(0, GRID_SIZE), random.randint(0, GRID_SIZE))
+        points_of_interest.append(point_of_interest)
+
+    users = []
+    for _ in range(number_of_users):
+        user = User()
+        user.model = model
+        user.mobility_model = point_of_interest_mobility
+        user.coordinates_trace = [(random.randint(0, GRID_SIZE), random.randint(0, GRID_SIZE))]
+        user.point_of_interest = random.choice(points_of_interest)
+        users.append(user)
+
+    return users
+
+
+def run(number_of_users: int, mobility_model: callable) -> float:
+    """Moves a group of users with a given mobility model.
+
+    Args:
+        number_of_users (int): Number of users to move.
+        mobility_model (callable): Function that moves a single user.
+
+    Returns:
+        float: Time spent per user per time step, in microseconds.
+    """
+    model = SimpleNamespace(schedule=SimpleNamespace(steps=0))
+    users = create_users(number_of_users=number_of_users, model=model)
+
+    start = time.perf_counter()
+    for step in range(1, NUMBER_OF_STEPS + 1):
+        model.schedule.steps = step
+        for user in users:
+            if len(user.coordinates_trace) <= step:
+                mobility_model(user)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / (number_of_users * NUMBER_OF_STEPS) * 1e6
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [5000, 20000]
+
+    models = {
+        "baseline": baseline_point_of_interest_mobility,
+        "point_of_interest_mobility": lambda user: user._mobility_model_function(user),
+    }
+
+    for number_of_users in sizes:
+        for name, mobility_model in models.items():
+            # Warming up caches before measuring
+            run(number_of_users=100, mobility_model=mobility_model)
+            print(f"{number_of_users} users | {name}: {run(number_of_users, mobility_model):.3f} us per user per step")
+
+
+if __name__ == "__main__":
+    main()
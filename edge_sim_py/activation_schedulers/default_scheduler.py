@@ -14,6 +14,7 @@ from ..components import (
     ContainerLayer,
     Application,
     ContainerImage,
+    PointOfInterest,
 )
 
 # Mesa modules
@@ -40,7 +41,11 @@ class DefaultScheduler(MesaBaseScheduler):
             - Container Registries
                 - Migration (provisioning) status update
 
+            - Points of Interest
+                - Peak status update
+
             - Users
+                - Points of interest
                 - Mobility
                 - Handoff
 
@@ -65,8 +70,12 @@ class DefaultScheduler(MesaBaseScheduler):
         for agent in NetworkFlow.all():
             agent.step()
 
-        for agent in User.all():
-            agent.step()
+        PointOfInterest.step_all(current_step=self.steps + 1)
+
+        # Users pick their points of interest all at once before being stepped
+        users = User.all()
+        User.step_point_of_interest_all(users=users)
+        User.step_all(users=users, update_point_of_interest=False)
 
         for agent in ContainerRegistry.all():
             agent.step()
@@ -6,6 +6,9 @@ from ..component_manager import ComponentManager
 # Mesa modules
 from mesa import Agent
 
+# Python libraries
+import sys
+
 
 class Application(ComponentManager, Agent):
     """Class that represents an application."""
@@ -31,6 +34,7 @@ class Application(ComponentManager, Agent):
         self.__class__._object_count += 1
         if obj_id is None:
             obj_id = self.__class__._object_count
+        self._id_str = None
         self.id = obj_id
 
         # Application label
@@ -77,6 +81,26 @@ class Application(ComponentManager, Agent):
         """Method that executes the events involving the object at each time step."""
         ...
 
+    @property
+    def id(self) -> int:
+        """Application identifier.
+
+        Returns:
+            int: Application identifier.
+        """
+        return self._id
+
+    @id.setter
+    def id(self, obj_id: int):
+        """Replaces the application identifier, caching its (interned) string form, which is used to index the metadata users
+        keep for the applications they access.
+
+        Args:
+            obj_id (int): New application identifier.
+        """
+        self._id = obj_id
+        self._id_str = sys.intern(str(obj_id))
+
     def connect_to_service(self, service: object) -> object:
         """Creates a relationship between the application and a given Service object.
 
@@ -14,6 +14,9 @@ class BaseStation(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Index of base stations by coordinates (kept up to date by the "coordinates" property)
+    _by_coords = {}
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a BaseStation object.
 
@@ -33,6 +36,7 @@ class BaseStation(ComponentManager, Agent):
         self.id = obj_id
 
         # Base station coordinates
+        self._coordinates = None
         self.coordinates: tuple[int, int] = (0, 0)
 
         # Base station wireless delay
@@ -84,6 +88,61 @@ class BaseStation(ComponentManager, Agent):
         """Method that executes the events involving the object at each time step."""
         ...
 
+    @property
+    def coordinates(self) -> tuple:
+        """Base station coordinates.
+
+        Returns:
+            tuple: Base station coordinates.
+        """
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: tuple):
+        """Moves the base station to a given position, updating the index of base stations by coordinates.
+
+        Args:
+            coordinates (tuple): New base station coordinates.
+        """
+        if self._coordinates is not None:
+            base_stations = self.__class__._by_coords.get(tuple(self._coordinates), [])
+            if self in base_stations:
+                base_stations.remove(self)
+
+        self._coordinates = coordinates
+
+        if coordinates is not None:
+            self.__class__._by_coords.setdefault(tuple(coordinates), []).append(self)
+
+    @classmethod
+    def find_by_coordinates(cls, coordinates: tuple) -> object:
+        """Finds the base station located at a given position. Coordinates stored as lists or tuples are treated alike.
+
+        Args:
+            coordinates (tuple): Base station coordinates.
+
+        Returns:
+            object: BaseStation object located at the given coordinates (or None if no base station is found).
+        """
+        base_stations = cls._by_coords.get(tuple(coordinates))
+        return base_stations[0] if base_stations else None
+
+    @classmethod
+    def remove(cls, obj: object):
+        """Removes a base station from the list of instances of the class and from the index of base stations by coordinates.
+
+        Args:
+            obj (object): Object to be removed.
+        """
+        super().remove(obj)
+
+        if obj._coordinates is not None:
+            base_stations = cls._by_coords.get(tuple(obj._coordinates), [])
+            if obj in base_stations:
+                base_stations.remove(obj)
+            if len(base_stations) == 0:
+                cls._by_coords.pop(tuple(obj._coordinates), None)
+
     def _connect_to_network_switch(self, network_switch: object) -> object:
         """Creates a relationship between the base station and a given networkSwitch object.
 
@@ -6,8 +6,7 @@
 # EdgeSimPy components
 # Python libraries
 import random
-
-import networkx as nx
+from itertools import chain, repeat
 
 from ..base_station import BaseStation
 from ..user import User
@@ -29,24 +28,31 @@ def pathway(user: User):
     n_paths = parameters["n_paths"] if "n_paths" in parameters else 1
 
     # Gathering the BaseStation located in the current client's location
-    current_node = BaseStation.find_by(attribute_name="coordinates", attribute_value=user.coordinates)
+    user_base_station = BaseStation.find_by_coordinates(coordinates=user.coordinates)
+    current_node = user_base_station
 
     # Defining the user's mobility path
     mobility_path = []
+    base_stations = BaseStation.all()
 
     for i in range(n_paths):
-        # Defining a target location and gathering the BaseStation located in that location
-        target_node = random.choice([bs for bs in BaseStation.all() if bs != current_node])
+        # Defining a target location and gathering the BaseStation located in that location. The target is drawn by rejection
+        # sampling over the list of base stations, which avoids building a filtered copy of the list for every draw
+        if len(base_stations) > 1:
+            target_node = current_node
+            while target_node is current_node:
+                target_node = base_stations[random.randrange(len(base_stations))]
+        else:
+            target_node = random.choice([bs for bs in base_stations if bs != current_node])
 
         # Calculating the shortest mobility path according to the Pathway mobility model
-        path = nx.shortest_path(G=user.model.topology, source=current_node.network_switch, target=target_node.network_switch)
+        path = user.model.topology._get_shortest_path(source=current_node.network_switch, target=target_node.network_switch)
         mobility_path.extend([network_switch.base_station for network_switch in path])
 
         if i < n_paths - 1:
             current_node = mobility_path.pop(-1)
 
         # Removing repeated entries
-        user_base_station = BaseStation.find_by(attribute_name="coordinates", attribute_value=user.coordinates)
         if user_base_station == mobility_path[0]:
             mobility_path.pop(0)
 
@@ -57,10 +63,8 @@ def pathway(user: User):
     if "seconds_to_move" in parameters and type(parameters["seconds_to_move"]) == int and parameters["seconds_to_move"] < 1:
         raise Exception("The 'seconds_to_move' key passed inside the mobility model's 'parameters' attribute must be > 1.")
 
-    seconds_to_move = parameters["seconds_to_move"] if "seconds_to_move" in parameters else 60
+    seconds_to_move = user._seconds_to_move
     seconds_to_move = max([1, int(seconds_to_move / user.model.tick_duration)])
 
-    mobility_path = [item for item in mobility_path for i in range(seconds_to_move)]
-
     # Adding the path that connects the current to the target location to the client's mobility trace
-    user.coordinates_trace.extend([bs.coordinates for bs in mobility_path])
+    user.coordinates_trace.extend(chain.from_iterable(repeat(bs.coordinates, seconds_to_move) for bs in mobility_path))
@@ -1,5 +1,6 @@
 """Contains a method that creates user mobility traces according to a custom Point of Interest mobility model."""
 
+# Python libraries
 import math
 
 from ..user import User
@@ -14,18 +15,62 @@ def point_of_interest_mobility(user: User):
     if user.point_of_interest is None:
         return
 
-    _parameters = getattr(user, "mobility_model_parameters", {})
-    (x1, y1) = user.coordinates_trace[-1]
+    # Number of moves towards the point of interest added each time the method is called ("n_moves" parameter). Defaults to 1.
+    n_moves = user._n_moves
+
+    (x, y) = user.coordinates_trace[-1]
     (x2, y2) = user.point_of_interest.coordinates
-    total_distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    movement_distance = user.movement_distance
+
+    coordinates_list = []
+    for _ in range(n_moves):
+        dx = x2 - x
+        dy = y2 - y
+        squared_distance = dx * dx + dy * dy
+
+        # Comparing squared distances so that the square root is only computed when the user actually needs to move
+        if squared_distance <= movement_distance * movement_distance:
+            coordinates = user.point_of_interest.coordinates
+            (x, y) = (x2, y2)
+        else:
+            ratio = movement_distance / math.sqrt(squared_distance)
+            x = x + dx * ratio
+            y = y + dy * ratio
+            coordinates = (x, y)
+
+        coordinates_list.append(coordinates)
 
-    if total_distance <= user.movement_distance:
-        user.coordinates_trace.extend((x2, y2))
-        user.coordinates = (x2, y2)
+    user.coordinates_trace.extend(coordinates_list)
+    user.coordinates = coordinates_list[-1]
+
+
+def _point_of_interest_mobility_single_move(user: User):
+    """Variant of 'point_of_interest_mobility' bound to users whose "n_moves" parameter is 1. It moves the user a single
+    position towards its point of interest without building an intermediate list of positions.
+
+    Args:
+        user (User): User whose mobility will be defined.
+    """
+    if user.point_of_interest is None:
         return
 
-    ratio = user.movement_distance / total_distance
-    x3 = x1 + (x2 - x1) * ratio
-    y3 = y1 + (y2 - y1) * ratio
-    user.coordinates_trace.append((x3, y3))
-    user.coordinates = (x3, y3)
+    (x1, y1) = user.coordinates_trace[-1]
+    (x2, y2) = user.point_of_interest.coordinates
+    movement_distance = user.movement_distance
+
+    dx = x2 - x1
+    dy = y2 - y1
+    squared_distance = dx * dx + dy * dy
+
+    if squared_distance <= movement_distance * movement_distance:
+        coordinates = user.point_of_interest.coordinates
+    else:
+        ratio = movement_distance / math.sqrt(squared_distance)
+        coordinates = (x1 + dx * ratio, y1 + dy * ratio)
+
+    user.coordinates_trace.append(coordinates)
+    user.coordinates = coordinates
+
+
+point_of_interest_mobility.single_move_variant = _point_of_interest_mobility_single_move
+
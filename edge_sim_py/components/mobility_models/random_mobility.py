@@ -3,6 +3,7 @@
 # EdgeSimPy components
 # Python libraries
 import random
+from itertools import chain, repeat
 
 from ..base_station import BaseStation
 from ..user import User
@@ -27,7 +28,7 @@ def random_mobility(user: User):
     n_moves = parameters["n_moves"] if "n_moves" in parameters else 5
 
     # Gathering the BaseStation located in the current client's location
-    current_node = BaseStation.find_by(attribute_name="coordinates", attribute_value=user.coordinates)
+    current_node = BaseStation.find_by_coordinates(coordinates=user.coordinates)
 
     # Random mobility path
     mobility_path = []
@@ -47,8 +48,8 @@ def random_mobility(user: User):
     # in the map. This parameter can be changed by passing a "seconds_to_move" key to the "parameters" parameter.
     if "seconds_to_move" in parameters and type(parameters["seconds_to_move"]) == int and parameters["seconds_to_move"] < 1:
         raise Exception("The 'seconds_to_move' key passed inside the mobility model's 'parameters' attribute must be > 1.")
-    seconds_to_move = parameters["seconds_to_move"] if "seconds_to_move" in parameters else 60
-    mobility_path = [item for item in mobility_path for i in range(int(seconds_to_move / user.model.tick_duration))]
+    seconds_to_move = user._seconds_to_move
+    repetitions = int(seconds_to_move / user.model.tick_duration)
 
     # Adding the path that connects the current to the target location to the client's mobility trace
-    user.coordinates_trace.extend([bs.coordinates for bs in mobility_path])
+    user.coordinates_trace.extend(chain.from_iterable(repeat(bs.coordinates, repetitions) for bs in mobility_path))
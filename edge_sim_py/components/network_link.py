@@ -14,6 +14,9 @@ class NetworkLink(dict, ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Counter incremented whenever the delay of any network link changes (used to discard cached lowest-delay paths)
+    _delay_version = 0
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkLink object.
 
@@ -48,6 +51,9 @@ class NetworkLink(dict, ComponentManager, Agent):
         # List of applications using the link for routing data to their users
         self["applications"] = []
 
+        # Number of communication paths of each application that pass through the link
+        self["application_paths"] = {}
+
         # List of network flows passing through the link
         self["active_flows"] = []
 
@@ -58,6 +64,18 @@ class NetworkLink(dict, ComponentManager, Agent):
         self["model"] = None
         self["unique_id"] = None
 
+    def __setitem__(self, attribute_name: str, attribute_value: object):
+        """Overrides the value of an object attribute, keeping track of changes to link delays.
+
+        Args:
+            attribute_name (str): Name of the attribute to be changed.
+            attribute_value (object): Value for the attribute.
+        """
+        if attribute_name == "delay":
+            NetworkLink._delay_version += 1
+
+        dict.__setitem__(self, attribute_name, attribute_value)
+
     def __getattr__(self, attribute_name: str):
         """Retrieves an object attribute by its name.
 
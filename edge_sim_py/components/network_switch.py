@@ -17,6 +17,9 @@ class NetworkSwitch(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Index of network switches by ID (kept up to date by the "id" property)
+    _by_id = {}
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkSwitch object.
 
@@ -33,6 +36,7 @@ class NetworkSwitch(ComponentManager, Agent):
         self.__class__._object_count += 1
         if obj_id is None:
             obj_id = self.__class__._object_count
+        self._id = None
         self.id = obj_id
 
         # Network switch coordinates
@@ -98,6 +102,57 @@ class NetworkSwitch(ComponentManager, Agent):
         """Method that executes the events involving the object at each time step."""
         ...
 
+    @property
+    def id(self) -> int:
+        """Network switch identifier.
+
+        Returns:
+            int: Network switch identifier.
+        """
+        return self._id
+
+    @id.setter
+    def id(self, obj_id: int):
+        """Replaces the network switch identifier, updating the index of network switches by ID.
+
+        Args:
+            obj_id (int): New network switch identifier.
+        """
+        if self.__class__._by_id.get(self._id) is self:
+            del self.__class__._by_id[self._id]
+
+        self._id = obj_id
+        self.__class__._by_id.setdefault(obj_id, self)
+
+    @classmethod
+    def find_by_id(cls, obj_id: int) -> object:
+        """Finds a network switch based on its ID attribute through the index of network switches by ID.
+
+        Args:
+            obj_id (int): Object ID.
+
+        Returns:
+            object: NetworkSwitch object found (or None if no network switch is found).
+        """
+        return cls._by_id.get(obj_id)
+
+    @classmethod
+    def remove(cls, obj: object):
+        """Removes a network switch from the list of instances of the class and from the index of network switches by ID.
+
+        Args:
+            obj (object): Object to be removed.
+        """
+        super().remove(obj)
+
+        if cls._by_id.get(obj._id) is obj:
+            del cls._by_id[obj._id]
+
+            # Another network switch sharing the removed switch's ID (if any) becomes the one found by that ID
+            switch = next((switch for switch in cls._instances if switch._id == obj._id), None)
+            if switch is not None:
+                cls._by_id[obj._id] = switch
+
     def get_power_consumption(self) -> float:
         """Gets the network switch's power consumption.
 
@@ -7,15 +7,34 @@ from ..component_manager import ComponentManager
 # Mesa modules
 from mesa import Agent, Model
 
+# Python libraries
+import numpy as np
+
 
 class PointOfInterest(ComponentManager, Agent):
     """Class that represents a Point of Interest."""
 
     # Class attributes that allow this class to use helper methods from the ComponentManager
     _instances = []
-    _instances_in_peak = []
     _object_count = 0
 
+    # Points of interest currently in peak. A dictionary is used as an insertion-ordered set so that membership updates are
+    # O(1) while keeping the iteration order (and thus random choices made over it) reproducible
+    _instances_in_peak = {}
+    _all_in_peak_cache = None
+
+    # Peak windows of all points of interest stacked into arrays (rebuilt whenever a peak window changes) alongside an array
+    # holding the points of interest themselves, the peak status of every point of interest at the last update, and the last
+    # time step in which the peak status was updated
+    _peak_bounds = None
+    _peak_instances = None
+    _was_in_peak = None
+    _last_step = None
+
+    # Coordinates of all points of interest stacked into a (N, 2) array, rebuilt on demand whenever a point of interest is
+    # created or moved. Each point of interest stores the index of its row in the "_coords_index" attribute
+    _coords_matrix = None
+
     def __init__(self, obj_id: Optional[int] = None):
         # Adding the new object to the list of instances of its class
         self.__class__._instances.append(self)
@@ -26,8 +45,12 @@ class PointOfInterest(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        self._coordinates_array = None
+        self._coords_index = None
         self.coordinates: Tuple[int, int] = (0, 0)
         self.name: str = ""
+        self._peak_start = 0
+        self._peak_end = 0
         self.peak_start: int = 0
         self.peak_end: int = 0
         self.is_in_peak: bool = False
@@ -52,19 +75,142 @@ class PointOfInterest(ComponentManager, Agent):
     def collect(self) -> dict:
         return {}
 
+    @property
+    def coordinates(self) -> tuple:
+        """Point of interest coordinates.
+
+        Returns:
+            tuple: Point of interest coordinates.
+        """
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: tuple):
+        """Moves the point of interest to a given position. Besides the tuple exposed to users (and used for comparisons and
+        serialization), the coordinates are kept as a float64 NumPy array that is read by the vectorized mobility models.
+
+        Args:
+            coordinates (tuple): New point of interest coordinates.
+        """
+        self._coordinates = tuple(coordinates)
+        self._coordinates_array = np.array(self._coordinates, dtype=np.float64)
+        self.__class__._coords_matrix = None
+
+    @property
+    def peak_start(self) -> int:
+        """Time step in which the point of interest's peak starts.
+
+        Returns:
+            int: Peak start.
+        """
+        return self._peak_start
+
+    @peak_start.setter
+    def peak_start(self, peak_start: int):
+        self._peak_start = peak_start
+        self.__class__._peak_bounds = None
+
+    @property
+    def peak_end(self) -> int:
+        """Time step in which the point of interest's peak ends (exclusive).
+
+        Returns:
+            int: Peak end.
+        """
+        return self._peak_end
+
+    @peak_end.setter
+    def peak_end(self, peak_end: int):
+        self._peak_end = peak_end
+        self.__class__._peak_bounds = None
+
     def step(self):
-        current_step: int = self.model.schedule.steps + 1
-        # TODO: maybe run this logic should only run if current_step % 100 = 0
-
-        # not in peak yet, but this step will start being
-        if not self.is_in_peak and current_step >= self.peak_start and current_step < self.peak_end:
-            self.is_in_peak = True
-            self.__class__._instances_in_peak.append(self)
-        # is in peak, but should not be anymore
-        elif self.is_in_peak and (current_step < self.peak_start or current_step >= self.peak_end):
-            self.is_in_peak = False
-            self.__class__._instances_in_peak.remove(self)
+        """Method that executes the events involving the object at each time step. The peak status of all points of interest
+        is updated at once by the first point of interest activated in the time step."""
+        self.__class__.step_all(current_step=self.model.schedule.steps + 1)
+
+    @classmethod
+    def step_all(cls, current_step: int):
+        """Updates the peak status of all points of interest at once. Calling this method more than once within the same time
+        step has no effect.
+
+        Args:
+            current_step (int): Time step.
+        """
+        if cls._last_step == current_step:
+            return
+        cls._last_step = current_step
+
+        # Stacking the peak windows of all points of interest into arrays in case any of them changed
+        if cls._peak_bounds is None or cls._peak_bounds.shape[1] != len(cls._instances):
+            cls._peak_bounds = np.array([[poi.peak_start, poi.peak_end] for poi in cls._instances]).reshape(-1, 2).T
+            cls._peak_instances = np.empty(len(cls._instances), dtype=object)
+            cls._peak_instances[:] = cls._instances
+            cls._was_in_peak = np.array([poi.is_in_peak for poi in cls._instances], dtype=bool)
+
+        peak_starts, peak_ends = cls._peak_bounds
+        in_peak = (peak_starts <= current_step) & (current_step < peak_ends)
+
+        # Only points of interest entering or leaving their peaks at this step need to be updated. Points of interest leaving
+        # their peaks are dropped in a single pass over the current peak collection, and those entering are appended at once
+        entering = cls._peak_instances[in_peak & ~cls._was_in_peak].tolist()
+        leaving = cls._peak_instances[~in_peak & cls._was_in_peak].tolist()
+
+        if len(leaving) > 0:
+            for point_of_interest in leaving:
+                point_of_interest.is_in_peak = False
+            cls._instances_in_peak = dict.fromkeys(poi for poi in cls._instances_in_peak if poi.is_in_peak)
+
+        if len(entering) > 0:
+            for point_of_interest in entering:
+                point_of_interest.is_in_peak = True
+            cls._instances_in_peak.update(dict.fromkeys(entering))
+
+        if len(entering) > 0 or len(leaving) > 0:
+            cls._all_in_peak_cache = None
+
+        cls._was_in_peak = in_peak
 
     @classmethod
     def all_in_peak(cls) -> list[Self]:
-        return cls._instances_in_peak
+        """Returns the list of points of interest currently in peak. The list is cached until a point of interest enters or
+        leaves its peak.
+
+        Returns:
+            list: Points of interest in peak.
+        """
+        if cls._all_in_peak_cache is None:
+            cls._all_in_peak_cache = list(cls._instances_in_peak)
+
+        return cls._all_in_peak_cache
+
+    @classmethod
+    def coordinates_matrix(cls) -> np.ndarray:
+        """Returns the coordinates of all points of interest as a (N, 2) array whose rows follow the order of the instances list.
+
+        Returns:
+            np.ndarray: Coordinates of all points of interest.
+        """
+        if cls._coords_matrix is None or len(cls._coords_matrix) != len(cls._instances):
+            for index, point_of_interest in enumerate(cls._instances):
+                point_of_interest._coords_index = index
+            cls._coords_matrix = np.array([poi._coordinates_array for poi in cls._instances], dtype=np.float64).reshape(-1, 2)
+
+        return cls._coords_matrix
+
+    @classmethod
+    def nearest(cls, coordinates: tuple) -> Optional[Self]:
+        """Finds the point of interest closest to a given position.
+
+        Args:
+            coordinates (tuple): Position whose closest point of interest will be found.
+
+        Returns:
+            PointOfInterest: Closest point of interest (or None if there are no points of interest).
+        """
+        coordinates_matrix = cls.coordinates_matrix()
+        if len(coordinates_matrix) == 0:
+            return None
+
+        deltas = coordinates_matrix - np.asarray(coordinates, dtype=np.float64)
+        return cls._instances[int(np.argmin(np.einsum("ij,ij->i", deltas, deltas)))]
@@ -0,0 +1,93 @@
+"""Contains the dictionaries that record whether users make requests to their applications."""
+
+# Time step keys ("0", "1", "2", ...) shared by all request flags, so that flags can be looked up by integer time step without
+# building a new string each time
+_STEP_KEYS = []
+
+
+class RequestFlags(dict):
+    """Dictionary of whether a user makes requests to an application at each time step. Time steps are keyed by their string
+    representation (e.g., {"1": False, "2": True}), as in the datasets."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def step_key(step: int) -> str:
+        """Gets the key of a given time step in the request flags.
+
+        Args:
+            step (int): Time step.
+
+        Returns:
+            str: Time step key.
+        """
+        if step < 0:
+            return str(step)
+
+        if step >= len(_STEP_KEYS):
+            _STEP_KEYS.extend(str(key) for key in range(len(_STEP_KEYS), step + 1))
+
+        return _STEP_KEYS[step]
+
+    def to_dict(self) -> dict:
+        """Returns the request flags as a plain dictionary keyed by time step.
+
+        Returns:
+            dict: Request flags.
+        """
+        return dict(self)
+
+
+class ApplicationRequestFlags(dict):
+    """Dictionary that maps application IDs to the "RequestFlags" of a user. Flags assigned as plain dictionaries (e.g.,
+    "user.making_requests[app_id] = {}") are stored as "RequestFlags" objects, so they must be modified through the dictionary
+    (e.g., "user.making_requests[app_id]["1"] = True") rather than through the assigned object."""
+
+    __slots__ = ()
+
+    def __init__(self, making_requests: dict = None, **kwargs):
+        """Creates a dictionary of request flags by application.
+
+        Args:
+            making_requests (dict, optional): Request flags of each application. Defaults to None.
+        """
+        super().__init__()
+        self.update(making_requests or {}, **kwargs)
+
+    def __setitem__(self, app_id: str, flags: dict):
+        super().__setitem__(app_id, flags if isinstance(flags, RequestFlags) else RequestFlags(flags or {}))
+
+    def __ior__(self, making_requests: dict) -> "ApplicationRequestFlags":
+        self.update(making_requests)
+        return self
+
+    def update(self, making_requests: dict = (), **kwargs):
+        """Adds the request flags of a set of applications.
+
+        Args:
+            making_requests (dict, optional): Request flags of each application. Defaults to ().
+        """
+        for app_id, flags in dict(making_requests, **kwargs).items():
+            self[app_id] = flags
+
+    def setdefault(self, app_id: str, flags: dict = None) -> RequestFlags:
+        """Gets the request flags of an application, adding them if the application has no flags yet.
+
+        Args:
+            app_id (str): Application ID.
+            flags (dict, optional): Flags added when the application has no flags. Defaults to None.
+
+        Returns:
+            RequestFlags: Request flags of the application.
+        """
+        if app_id not in self:
+            self[app_id] = flags
+        return self[app_id]
+
+    def to_dict(self) -> dict:
+        """Returns the request flags of each application as plain dictionaries.
+
+        Returns:
+            dict: Request flags of each application.
+        """
+        return {app_id: flags.to_dict() for app_id, flags in self.items()}
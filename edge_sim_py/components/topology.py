@@ -3,6 +3,7 @@
 # EdgeSimPy components
 from ..component_manager import ComponentManager
 from ..components.network_flow import NetworkFlow
+from ..components.network_link import NetworkLink
 
 # Mesa modules
 from mesa import Agent
@@ -18,6 +19,10 @@ class Topology(ComponentManager, nx.Graph, Agent):
     _instances = []
     _object_count = 0
 
+    # Number of times network nodes or links were added to or removed from topologies. Paths computed before the structure of
+    # a topology changes are discarded when the next path is requested
+    _structure_version = 0
+
     def __init__(self, obj_id: int = None, existing_graph: nx.Graph = None) -> object:
         """Creates a Topology object backed by NetworkX functionality.
 
@@ -43,10 +48,65 @@ class Topology(ComponentManager, nx.Graph, Agent):
         else:
             nx.Graph.__init__(self, incoming_graph_data=existing_graph)
 
+        # Shortest paths (in number of hops) between pairs of network nodes. Network nodes are enumerated and the next hops
+        # towards each target node are stored as a list ("_next_hops[v][u]" is the index of the node that follows "u" on the
+        # way to "v"), which is only computed when a path to that target is requested. Queries involving objects that are not
+        # nodes of the topology are memoized apart
+        self._nodes_by_index = []
+        self._node_indices = {}
+        self._indexed_structure_version = None
+        self._next_hops = {}
+        self._shortest_paths = {}
+
+        # Lowest-delay paths between pairs of network nodes, stored as next hops like the ones above. As link delays may
+        # change during the simulation, these next hops are discarded whenever the delay of any network link is updated
+        self._delay_next_hops = {}
+        self._delay_version = None
+
         # Model-specific attributes (defined inside the model's "initialize()" method)
         self.model = None
         self.unique_id = None
 
+    def add_node(self, node_for_adding: object, **attr):
+        nx.Graph.add_node(self, node_for_adding, **attr)
+        Topology._structure_version += 1
+
+    def add_nodes_from(self, nodes_for_adding: list, **attr):
+        nx.Graph.add_nodes_from(self, nodes_for_adding, **attr)
+        Topology._structure_version += 1
+
+    def remove_node(self, n: object):
+        nx.Graph.remove_node(self, n)
+        Topology._structure_version += 1
+
+    def remove_nodes_from(self, nodes: list):
+        nx.Graph.remove_nodes_from(self, nodes)
+        Topology._structure_version += 1
+
+    def add_edge(self, u_of_edge: object, v_of_edge: object, **attr):
+        nx.Graph.add_edge(self, u_of_edge, v_of_edge, **attr)
+        Topology._structure_version += 1
+
+    def add_edges_from(self, ebunch_to_add: list, **attr):
+        nx.Graph.add_edges_from(self, ebunch_to_add, **attr)
+        Topology._structure_version += 1
+
+    def remove_edge(self, u: object, v: object):
+        nx.Graph.remove_edge(self, u, v)
+        Topology._structure_version += 1
+
+    def remove_edges_from(self, ebunch: list):
+        nx.Graph.remove_edges_from(self, ebunch)
+        Topology._structure_version += 1
+
+    def clear(self):
+        nx.Graph.clear(self)
+        Topology._structure_version += 1
+
+    def clear_edges(self):
+        nx.Graph.clear_edges(self)
+        Topology._structure_version += 1
+
     def _to_dict(self) -> dict:
         """Method that overrides the way the object is formatted to JSON."
 
@@ -86,6 +146,130 @@ class Topology(ComponentManager, nx.Graph, Agent):
 
         return modified_path
 
+    def _get_shortest_path(self, source: object, target: object) -> list:
+        """Gets the shortest path (in number of hops) between two network nodes. The next hops towards a target node are
+        computed the first time a path to it is requested, and are reused until network nodes or links are added or removed.
+
+        Args:
+            source (object): Source network node.
+            target (object): Target network node.
+
+        Returns:
+            path (list): Shortest path between the source and target network nodes.
+        """
+        if self._indexed_structure_version != Topology._structure_version:
+            self._index_nodes()
+
+        source_index = self._node_indices.get(source)
+        target_index = self._node_indices.get(target)
+
+        if source_index is None or target_index is None:
+            path = self._shortest_paths.get((source, target))
+            if path is None:
+                path = nx.shortest_path(G=self, source=source, target=target)
+                self._shortest_paths[(source, target)] = path
+            return path
+
+        next_hops = self._next_hops.get(target_index)
+        if next_hops is None:
+            next_hops = self._fill_next_hops(target_index=target_index)
+
+        if next_hops[source_index] < 0:
+            raise nx.NetworkXNoPath(f"Target {target} cannot be reached from source {source}.")
+
+        return self._follow_next_hops(next_hops=next_hops, source_index=source_index, target_index=target_index)
+
+    def _get_lowest_delay_path(self, source: object, target: object) -> list:
+        """Gets the path with the lowest communication delay between two network nodes. The next hops towards a target node
+        are computed the first time a path to it is requested, and are reused until the delay of some network link changes or
+        network nodes or links are added or removed.
+
+        Args:
+            source (object): Source network node.
+            target (object): Target network node.
+
+        Returns:
+            path (list): Lowest-delay path between the source and target network nodes.
+        """
+        if self._indexed_structure_version != Topology._structure_version:
+            self._index_nodes()
+
+        source_index = self._node_indices.get(source)
+        target_index = self._node_indices.get(target)
+
+        if source_index is None or target_index is None:
+            return nx.shortest_path(G=self, source=source, target=target, weight="delay", method="dijkstra")
+
+        if self._delay_version != NetworkLink._delay_version:
+            self._delay_next_hops.clear()
+            self._delay_version = NetworkLink._delay_version
+
+        next_hops = self._delay_next_hops.get(target_index)
+        if next_hops is None:
+            next_hops = self._fill_next_hops(target_index=target_index, weight="delay")
+
+        if next_hops[source_index] < 0:
+            raise nx.NetworkXNoPath(f"Target {target} cannot be reached from source {source}.")
+
+        return self._follow_next_hops(next_hops=next_hops, source_index=source_index, target_index=target_index)
+
+    def _follow_next_hops(self, next_hops: list, source_index: int, target_index: int) -> list:
+        """Builds the path between two network nodes by following the next hops towards the target node.
+
+        Args:
+            next_hops (list): Next hop from each network node towards the target node.
+            source_index (int): Index of the source network node.
+            target_index (int): Index of the target network node.
+
+        Returns:
+            path (list): Path between the source and target network nodes.
+        """
+        path_indices = [source_index]
+        node_index = source_index
+        while node_index != target_index:
+            node_index = next_hops[node_index]
+            path_indices.append(node_index)
+
+        nodes_by_index = self._nodes_by_index
+        return [nodes_by_index[node_index] for node_index in path_indices]
+
+    def _index_nodes(self):
+        """Enumerates the topology nodes, discarding the paths computed so far."""
+        self._nodes_by_index = list(self.nodes)
+        self._node_indices = {node: index for index, node in enumerate(self._nodes_by_index)}
+        self._indexed_structure_version = Topology._structure_version
+        self._next_hops = {}
+        self._delay_next_hops = {}
+        self._shortest_paths = {}
+
+    def _fill_next_hops(self, target_index: int, weight: str = None) -> list:
+        """Computes the next hop from every network node towards a target node using a search from the target. Paths are
+        measured in number of hops by default, or by the sum of a given link attribute otherwise.
+
+        Args:
+            target_index (int): Index of the target network node.
+            weight (str, optional): Link attribute used as the distance between nodes. Defaults to None (number of hops).
+
+        Returns:
+            next_hops (list): Next hop from each network node towards the target node (-1 for nodes that cannot reach it).
+        """
+        node_indices = self._node_indices
+        target = self._nodes_by_index[target_index]
+
+        next_hops = [-1] * len(node_indices)
+
+        if weight is None:
+            predecessors_by_node = nx.predecessor(G=self, source=target)
+            self._next_hops[target_index] = next_hops
+        else:
+            predecessors_by_node, _ = nx.dijkstra_predecessor_and_distance(G=self, source=target, weight=weight)
+            self._delay_next_hops[target_index] = next_hops
+
+        for node, predecessors in predecessors_by_node.items():
+            next_hops[node_indices[node]] = node_indices[predecessors[0]] if len(predecessors) > 0 else target_index
+
+        return next_hops
+
     def calculate_path_delay(self, path: list) -> int:
         """Calculates the communication delay of a network path.
 
@@ -97,8 +281,14 @@ class Topology(ComponentManager, nx.Graph, Agent):
         """
         path_delay = 0
 
-        # Calculates the communication delay based on the delay property of each network link in the path
-        path_delay = nx.classes.function.path_weight(G=self, path=path, weight="delay")
+        # Calculates the communication delay based on the delay property of each network link in the path. Links are read
+        # straight from the adjacency structure, which avoids the views and path validation done by NetworkX's "path_weight()"
+        adjacency = self._adj
+        try:
+            for node, next_node in zip(path, path[1:]):
+                path_delay += adjacency[node][next_node]["delay"]
+        except KeyError:
+            raise nx.NetworkXNoPath("path does not exist")
 
         return path_delay
 
@@ -117,11 +307,14 @@ class Topology(ComponentManager, nx.Graph, Agent):
 
                     link = self[node1][node2]
 
+                    link["application_paths"][app] = link["application_paths"].get(app, 0) + 1
                     if app not in link["applications"]:
                         link["applications"].append(app)
 
     def _release_communication_path(self, communication_path: list, app: object):
-        """Releases the demand of a given application from a set of links that comprehend a communication path.
+        """Releases the demand of a given application from a set of links that comprehend a communication path. Applications
+        are only removed from links that are not part of any other communication path of theirs (e.g., the paths of other
+        users accessing the same application).
 
         Args:
             communication_path (list): Communication path.
@@ -134,5 +327,10 @@ class Topology(ComponentManager, nx.Graph, Agent):
                     node2 = path[i + 1]
                     link = self[node1][node2]
 
-                    if app in link["applications"]:
-                        link["applications"].remove(app)
+                    application_paths = link["application_paths"].get(app, 0) - 1
+                    if application_paths > 0:
+                        link["application_paths"][app] = application_paths
+                    else:
+                        link["application_paths"].pop(app, None)
+                        if app in link["applications"]:
+                            link["applications"].remove(app)
@@ -4,9 +4,10 @@
 # Python libraries
 import copy
 import random
+from itertools import compress
 from typing import Callable, Optional, Tuple
 
-import networkx as nx
+import numpy as np
 
 # Mesa modules
 from mesa import Agent, Model
@@ -14,11 +15,99 @@ from mesa import Agent, Model
 from ..component_manager import ComponentManager
 from .application import Application
 from .base_station import BaseStation
+from .network_link import NetworkLink
 from .network_switch import NetworkSwitch
 from .point_of_interest import PointOfInterest
+from .request_flags import ApplicationRequestFlags, RequestFlags
 from .topology import Topology
 
 
+def _naive_deepcopy(obj: object) -> object:
+    """Creates a deep copy of nested dictionaries and lists. Any other value is shared with the original object, which is
+    enough for the attributes copied when users are exported or collected (nested dictionaries and lists of scalars) and
+    avoids the memo and reduce dispatch performed by "copy.deepcopy()".
+
+    Args:
+        obj (object): Object to be copied.
+
+    Returns:
+        object: Copy of the object.
+    """
+    if type(obj) is dict:
+        return {key: _naive_deepcopy(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_naive_deepcopy(item) for item in obj]
+    return obj
+
+
+class MobilityModelParameters(dict):
+    """Dictionary that stores the parameters of a user's mobility model. Parameters read by mobility models at every call are
+    bound to plain attributes of the user, which are updated whenever the dictionary changes. Copies of the dictionary made
+    without copying the user (e.g., "copy.deepcopy(user.mobility_model_parameters)") are detached from the user."""
+
+    __slots__ = ("_user",)
+
+    def __init__(self, user: object, parameters: dict):
+        """Creates a dictionary of mobility model parameters.
+
+        Args:
+            user (object): User whose mobility model receives the parameters.
+            parameters (dict): Mobility model parameters.
+        """
+        super().__init__(parameters)
+        self._user = user
+
+    def __deepcopy__(self, memo: dict) -> "MobilityModelParameters":
+        parameters = MobilityModelParameters.__new__(MobilityModelParameters)
+        memo[id(self)] = parameters
+
+        # The copy stays attached only to a copy of the user that is being made in the same "copy.deepcopy()" call
+        parameters._user = memo.get(id(getattr(self, "_user", None)))
+        dict.update(parameters, copy.deepcopy(dict(self), memo))
+        return parameters
+
+    def _bind(self):
+        """Updates the attributes bound to the parameters, provided that the dictionary still stores the user's parameters."""
+        user = getattr(self, "_user", None)
+        if user is not None and getattr(user, "_mobility_model_parameters", None) is self:
+            user._bind_mobility_model_parameters()
+
+    def __setitem__(self, key: str, value: object):
+        super().__setitem__(key, value)
+        self._bind()
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self._bind()
+
+    def __ior__(self, parameters: dict) -> "MobilityModelParameters":
+        self.update(parameters)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._bind()
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        value = super().setdefault(key, default)
+        self._bind()
+        return value
+
+    def pop(self, *args) -> object:
+        value = super().pop(*args)
+        self._bind()
+        return value
+
+    def popitem(self) -> tuple:
+        item = super().popitem()
+        self._bind()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._bind()
+
+
 class User(ComponentManager, Agent):
     """Class that represents an user."""
 
@@ -54,19 +143,24 @@ class User(ComponentManager, Agent):
         # Reference to the base station the user is connected to
         self.base_station: BaseStation = BaseStation()
 
-        # User access metadata
-        self.making_requests = {}
+        # User access metadata. Request flags of each application are kept as RequestFlags objects
+        self._making_requests = ApplicationRequestFlags()
         self.access_patterns = {}
 
         # User mobility model
-        self.mobility_model: Callable[[User], None] = lambda user: None
+        self._mobility_model = None
         self.mobility_model_parameters = {}
+        self.mobility_model: Callable[[User], None] = lambda user: None
 
         # List of metadata from applications accessed by the user
         self.communication_paths = {}
         self.delays = {}
         self.delay_slas = {}
 
+        # Communication paths last computed for each application, along with the base stations and link delays they were
+        # computed for (used to skip recomputations while none of them changes)
+        self._communication_path_cache = {}
+
         # Model-specific attributes (defined inside the model's "initialize()" method)
         self.model: Model = Model()
         self.unique_id: int = 0
@@ -90,12 +184,12 @@ class User(ComponentManager, Agent):
                 "id": self.id,
                 "coordinates": self.coordinates,
                 "coordinates_trace": self.coordinates_trace,
-                "delays": copy.deepcopy(self.delays),
-                "delay_slas": copy.deepcopy(self.delay_slas),
-                "communication_paths": copy.deepcopy(self.communication_paths),
-                "making_requests": copy.deepcopy(self.making_requests),
+                "delays": dict(self.delays),
+                "delay_slas": dict(self.delay_slas),
+                "communication_paths": _naive_deepcopy(self.communication_paths),
+                "making_requests": self.making_requests.to_dict(),
                 "mobility_model_parameters": (
-                    copy.deepcopy(self.mobility_model_parameters) if self.mobility_model_parameters else {}
+                    _naive_deepcopy(dict(self.mobility_model_parameters)) if self.mobility_model_parameters else {}
                 ),
             },
             "relationships": {
@@ -116,6 +210,83 @@ class User(ComponentManager, Agent):
         }
         return dictionary
 
+    @property
+    def mobility_model(self) -> Callable:
+        """Function that defines the user's mobility.
+
+        Returns:
+            Callable: Mobility model.
+        """
+        return self._mobility_model
+
+    @mobility_model.setter
+    def mobility_model(self, mobility_model: Callable):
+        """Replaces the user's mobility model.
+
+        Args:
+            mobility_model (Callable): Mobility model.
+        """
+        self._mobility_model = mobility_model
+        self._bind_mobility_model()
+
+    def _bind_mobility_model(self):
+        """Defines the function called by the user at each time step to extend its coordinates trace. Mobility models that
+        provide a variant specialized for users moving a single position per call (through a "single_move_variant" attribute)
+        have that variant bound when the user's "n_moves" parameter is 1, so that the choice is made once instead of every step.
+        """
+        mobility_model = self._mobility_model
+        if self._n_moves == 1:
+            mobility_model = getattr(mobility_model, "single_move_variant", mobility_model)
+
+        self._mobility_model_function = mobility_model
+
+    @property
+    def mobility_model_parameters(self) -> dict:
+        """Parameters of the user's mobility model.
+
+        Returns:
+            dict: Mobility model parameters.
+        """
+        return self._mobility_model_parameters
+
+    @mobility_model_parameters.setter
+    def mobility_model_parameters(self, parameters: dict):
+        """Replaces the parameters of the user's mobility model. The parameters are stored in a "MobilityModelParameters"
+        dictionary, so that parameters bound to plain attributes are also updated when the dictionary is edited in place.
+
+        Args:
+            parameters (dict): Mobility model parameters.
+        """
+        self._mobility_model_parameters = (
+            MobilityModelParameters(user=self, parameters=parameters) if parameters is not None else None
+        )
+        self._bind_mobility_model_parameters()
+
+    def _bind_mobility_model_parameters(self):
+        """Binds the mobility model parameters read at every call of the user's mobility model to plain attributes."""
+        parameters = self._mobility_model_parameters if self._mobility_model_parameters else {}
+        self._n_moves = parameters.get("n_moves", 1)
+        self._seconds_to_move = parameters.get("seconds_to_move", 60)
+        self._bind_mobility_model()
+
+    @property
+    def making_requests(self) -> dict:
+        """Whether the user makes requests to each application at each time step, keyed by application ID and time step.
+
+        Returns:
+            dict: Request flags of each application.
+        """
+        return self._making_requests
+
+    @making_requests.setter
+    def making_requests(self, making_requests: dict):
+        """Replaces the request flags of the user's applications.
+
+        Args:
+            making_requests (dict): Request flags of each application (e.g., {"1": {"1": False, "2": True}}).
+        """
+        self._making_requests = ApplicationRequestFlags(making_requests)
+
     def collect(self) -> dict:
         """Method that collects a set of metrics for the object.
 
@@ -124,101 +295,139 @@ class User(ComponentManager, Agent):
         """
         access_history = {}
         for app in self.applications:
-            access_history[str(app.id)] = self.access_patterns[str(app.id)].history
+            access_history[app._id_str] = self.access_patterns[app._id_str].history
 
         metrics = {
             "Instance ID": self.id,
             "Coordinates": self.coordinates,
             "Base Station": f"{self.base_station} ({self.base_station.coordinates})" if self.base_station else None,
-            "Delays": copy.deepcopy(self.delays),
-            "Communication Paths": copy.deepcopy(self.communication_paths),
-            "Making Requests": copy.deepcopy(self.making_requests),
-            "Access History": copy.deepcopy(access_history),
+            "Delays": dict(self.delays),
+            "Communication Paths": _naive_deepcopy(self.communication_paths),
+            "Making Requests": self.making_requests.to_dict(),
+            "Access History": _naive_deepcopy(access_history),
         }
         return metrics
 
-    def step(self):
-        """Method that executes the events involving the object at each time step."""
+    @classmethod
+    def step_all(cls, users: list, update_point_of_interest: bool = True):
+        """Executes the events involving a group of users at the current time step. As service availability does not change while
+        users are stepped, whether each application is available is checked once and shared by all users that access it.
+
+        Args:
+            users (list): Users whose step is executed (in the given order).
+            update_point_of_interest (bool, optional): Whether users' points of interest must be updated within their steps.
+                Defaults to True.
+        """
+        applications_available = {}
+        for user in users:
+            for app in user.applications:
+                if app not in applications_available:
+                    applications_available[app] = all(s._available for s in app.services)
+
+        for user in users:
+            user.step(update_point_of_interest=update_point_of_interest, applications_available=applications_available)
+
+    def step(self, update_point_of_interest: bool = True, applications_available: dict = None):
+        """Method that executes the events involving the object at each time step.
+
+        Args:
+            update_point_of_interest (bool, optional): Whether the user's point of interest must be updated within this method.
+                Schedulers that update the points of interest of all users beforehand set this to False. Defaults to True.
+            applications_available (dict, optional): Whether all services of each of the user's applications are available,
+                keyed by application. Computed within this method when not informed. Defaults to None.
+        """
         # Updating user access
         current_step = self.model.schedule.steps + 1
+        current_step_key = RequestFlags.step_key(current_step)
+        next_step_key = RequestFlags.step_key(current_step + 1)
+
+        if update_point_of_interest:
+            self.step_point_of_interest()
 
-        self.step_point_of_interest()
+        if applications_available is None:
+            applications_available = {app: all(s._available for s in app.services) for app in self.applications}
 
         for app in self.applications:
-            last_access = self.access_patterns[str(app.id)].history[-1]
+            app_id = app._id_str
+            making_requests = self._making_requests[app_id]
+            last_access = self.access_patterns[app_id].history[-1]
 
             # Updating user access waiting and access times. Waiting time represents the period in which the user is waiting for
             # his application to be provisioned. Access time represents the period in which the user is successfully accessing
             # his application, meaning his application is available. We assume that an application is only available when all its
             # services are available.
-            if self.making_requests[str(app.id)][str(current_step)] == True:
-                if len([s for s in app.services if s._available]) == len(app.services):
+            if making_requests[current_step_key]:
+                if applications_available[app]:
                     last_access["access_time"] += 1
                 else:
                     last_access["waiting_time"] += 1
 
             # Updating user's making requests attribute for the next time step
             if current_step + 1 >= last_access["start"] and current_step + 1 <= last_access["end"]:
-                self.making_requests[str(app.id)][str(current_step + 1)] = True
+                making_requests[next_step_key] = True
             else:
-                self.making_requests[str(app.id)][str(current_step + 1)] = False
+                making_requests[next_step_key] = False
 
             # Creating new access request if needed
             if current_step + 1 == last_access["next_access"]:
-                self.making_requests[str(app.id)][str(current_step + 1)] = True
-                self.access_patterns[str(app.id)].get_next_access(start=current_step + 1)
+                making_requests[next_step_key] = True
+                self.access_patterns[app_id].get_next_access(start=current_step + 1)
 
         # Re-executing user's mobility model in case no future mobility track is known by the simulator
         if len(self.coordinates_trace) <= self.model.schedule.steps:
-            self.mobility_model(self)
+            self._mobility_model_function(self)
 
         # Updating user's location
         if self.coordinates != self.coordinates_trace[self.model.schedule.steps]:
             self.coordinates = self.coordinates_trace[self.model.schedule.steps]
 
             # Connecting the user to the closest base station
-            self.base_station = BaseStation.find_by(attribute_name="coordinates", attribute_value=self.coordinates)
+            self.base_station = BaseStation.find_by_coordinates(coordinates=self.coordinates)
 
             for application in self.applications:
                 # Only updates the routing path of apps available (i.e., whose services are available)
-                services_available = len([s for s in application.services if s._available])
-                if services_available == len(application.services):
+                if applications_available[application]:
                     # Recomputing user communication paths
                     self.set_communication_path(app=application)
                 else:
-                    self.communication_paths[str(application.id)] = []
+                    self._release_communication_path(app=application)
+                    self.communication_paths[application._id_str] = []
                     self._compute_delay(app=application)
 
-    def _compute_delay(self, app: Application, metric: str = "latency") -> int:
+    def _compute_delay(self, app: Application, metric: str = "latency", path_delay: float = None) -> int:
         """Computes the delay of an application accessed by the user.
 
         Args:
             metric (str, optional): Delay measure (valid options: 'latency' and 'response time'). Defaults to 'latency'.
             app (object): Application accessed by the user.
+            path_delay (float, optional): Delay of the user's communication path to the application. Computed from the user's
+                communication paths when not informed. Defaults to None.
 
         Returns:
             delay (int): User-perceived delay when accessing application "app".
         """
-        topology = Topology.first()
-
-        services_available = len([s for s in app.services if s._available])
-        if services_available < len(app.services):
+        if not all(s._available for s in app.services):
             # Defining the delay as infinity if any of the application services is not available
             delay = float("inf")
         else:
-            # Initializes the application's delay with the time it takes to communicate its client and his base station
-            delay = self.base_station.wireless_delay
-
-            # Adding the communication path delay to the application's delay
-            for path in self.communication_paths[str(app.id)]:
-                delay += topology.calculate_path_delay(path=[NetworkSwitch.find_by_id(i) for i in path])
+            # Calculating the communication path delay unless it is already known
+            if path_delay is None:
+                topology = Topology.first()
+                find_switch = NetworkSwitch.find_by_id
+                path_delay = 0
+                for path in self.communication_paths[app._id_str]:
+                    path_delay += topology.calculate_path_delay(path=[find_switch(i) for i in path])
+
+            # The application's delay comprises the time it takes to communicate its client and his base station and the
+            # communication path delay
+            delay = self.base_station.wireless_delay + path_delay
 
             if metric.lower() == "response time":
                 # We assume that Response Time = Latency * 2
                 delay = delay * 2
 
         # Updating application delay inside user's 'applications' attribute
-        self.delays[str(app.id)] = delay
+        self.delays[app._id_str] = delay
 
         return delay
 
@@ -233,50 +442,82 @@ class User(ComponentManager, Agent):
             list: Updated communication path.
         """
         topology = Topology.first()
+        app_id = app._id_str
+        previous_path = self.communication_paths.get(app_id)
+        cached_path = self._communication_path_cache.get(app_id)
 
         # Releasing links used in the past to connect the user with its application
-        if app in self.communication_paths:
-            path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
-            topology._release_communication_path(communication_path=path, app=app)
+        self._release_communication_path(app=app)
 
-        # Defining communication path
+        # Defining communication path. The delay of paths computed here is kept along with them, while the delay of
+        # user-specified paths is calculated when the application's delay is computed
+        path_delay = None
         if len(communication_path) > 0:
-            self.communication_paths[str(app.id)] = communication_path
-        else:
-            self.communication_paths[str(app.id)] = []
+            self.communication_paths[app_id] = communication_path
+            self._communication_path_cache.pop(app_id, None)
 
+            # Computing the new demand of chosen links
+            switch_paths = [[NetworkSwitch.find_by_id(i) for i in p] for p in communication_path]
+            topology._allocate_communication_path(communication_path=switch_paths, app=app)
+        else:
             service_hosts_base_stations = [service.server.base_station for service in app.services if service.server]
             communication_chain = [self.base_station] + service_hosts_base_stations
 
-            # Defining a set of links to connect the items in the application's service chain
-            for i in range(len(communication_chain) - 1):
-                # Defining origin and target nodes
-                origin = communication_chain[i]
-                target = communication_chain[i + 1]
+            # Reusing the communication path computed last time if neither the base stations in the application's service chain,
+            # the delay of any network link nor the topology structure changed since then
+            cache_key = (tuple(communication_chain), NetworkLink._delay_version, Topology._structure_version)
+            if cached_path is not None and cached_path[0] == cache_key and cached_path[1] is previous_path:
+                switch_paths, path_delay = cached_path[2], cached_path[3]
+            else:
+                self.communication_paths[app_id] = []
+                switch_paths = []
 
-                # Finding and storing the best communication path between the origin and target nodes
-                if origin == target:
-                    path = []
-                else:
-                    path = nx.shortest_path(
-                        G=topology,
-                        source=origin.network_switch,
-                        target=target.network_switch,
-                        weight="delay",
-                        method="dijkstra",
-                    )
+                # Defining a set of links to connect the items in the application's service chain
+                for i in range(len(communication_chain) - 1):
+                    # Defining origin and target nodes
+                    origin = communication_chain[i]
+                    target = communication_chain[i + 1]
+
+                    # Finding and storing the best communication path between the origin and target nodes
+                    if origin == target:
+                        path = []
+                    else:
+                        path = topology._get_lowest_delay_path(source=origin.network_switch, target=target.network_switch)
 
-                # Adding the best path found to the communication path
-                self.communication_paths[str(app.id)].append([network_switch.id for network_switch in path])
+                    # Adding the best path found to the communication path
+                    self.communication_paths[app_id].append([network_switch.id for network_switch in path])
+                    switch_paths.append(path)
 
-                # Computing the new demand of chosen links
-                path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
-                topology._allocate_communication_path(communication_path=path, app=app)
+                path_delay = sum(topology.calculate_path_delay(path=path) for path in switch_paths)
+                self._communication_path_cache[app_id] = (cache_key, self.communication_paths[app_id], switch_paths, path_delay)
+
+            # Computing the new demand of chosen links
+            topology._allocate_communication_path(communication_path=switch_paths, app=app)
 
         # Computing application's delay
-        self._compute_delay(app=app, metric="latency")
+        self._compute_delay(app=app, metric="latency", path_delay=path_delay)
+
+        return self.communication_paths[app_id]
 
-        return self.communication_paths[str(app.id)]
+    def _release_communication_path(self, app: Application):
+        """Releases the links used by the user to communicate with a given application.
+
+        Args:
+            app (object): User application.
+        """
+        app_id = app._id_str
+        previous_path = self.communication_paths.get(app_id)
+        if not previous_path:
+            return
+
+        # Paths computed by "set_communication_path()" are kept as lists of network switches in the cache, so that only paths
+        # specified elsewhere must be resolved from switch IDs
+        cached_path = self._communication_path_cache.get(app_id)
+        if cached_path is not None and cached_path[1] is previous_path:
+            path = cached_path[2]
+        else:
+            path = [[NetworkSwitch.find_by_id(i) for i in p] for p in previous_path]
+        Topology.first()._release_communication_path(communication_path=path, app=app)
 
     def _connect_to_application(self, app: Application, delay_sla: float):
         """Connects the user to a given application, establishing all the relationship attributes in both objects.
@@ -293,8 +534,8 @@ class User(ComponentManager, Agent):
         app.users.append(self)
 
         # Assigning delay and delay SLA attributes. Delay is initially None, and must be overwritten by the service placement
-        self.delay_slas[str(app.id)] = delay_sla
-        self.delays[str(app.id)] = None
+        self.delay_slas[app._id_str] = delay_sla
+        self.delays[app._id_str] = None
 
     def _set_initial_position(self, coordinates: list, number_of_replicates: int = 0) -> object:
         """Defines the initial coordinates for the user, automatically connecting to a base station in that position.
@@ -311,7 +552,7 @@ class User(ComponentManager, Agent):
         self.coordinates_trace = [coordinates for _ in range(number_of_replicates - 1)]
 
         # Connecting the user to the base station that shares his initial position
-        base_station = BaseStation.find_by(attribute_name="coordinates", attribute_value=self.coordinates)
+        base_station = BaseStation.find_by_coordinates(coordinates=self.coordinates)
 
         if base_station is None:
             raise Exception(f"No base station was found at coordinates {coordinates} to connect to user {self}.")
@@ -337,6 +578,34 @@ class User(ComponentManager, Agent):
         elif not self.point_of_interest.is_in_peak:
             self.point_of_interest = None
 
+    @classmethod
+    def step_point_of_interest_all(cls, users: list):
+        """Batched version of "step_point_of_interest()" that updates the points of interest of a group of users at once. The
+        random draws of all users are made in bulk by a NumPy generator seeded from Python's "random" module, so that seeded
+        simulations remain reproducible.
+
+        Args:
+            users (list): Users whose points of interest are updated.
+        """
+        users_without_poi = []
+        for user in users:
+            if user.point_of_interest is None:
+                users_without_poi.append(user)
+            elif not user.point_of_interest.is_in_peak:
+                user.point_of_interest = None
+
+        pois_in_peak = PointOfInterest.all_in_peak()
+        if len(users_without_poi) == 0 or len(pois_in_peak) == 0:
+            return
+
+        # Random 60% chance of getting a point of interest
+        rng = np.random.default_rng(random.getrandbits(64))
+        interested = rng.integers(0, 101, size=len(users_without_poi)) < 60
+        choices = rng.integers(0, len(pois_in_peak), size=len(users_without_poi))
+
+        for user, poi_index in zip(compress(users_without_poi, interested), choices[interested].tolist()):
+            user.point_of_interest = pois_in_peak[poi_index]
+
     @classmethod
     def random_user_placement(cls, grid_coordinates: list[(int, int)]) -> tuple[int, int]:
         """Method that determines the coordinates of a given user randomly.
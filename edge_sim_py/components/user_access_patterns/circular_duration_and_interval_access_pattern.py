@@ -58,9 +58,7 @@ class CircularDurationAndIntervalAccessPattern(ComponentManager):
         # Updating the user "making_request" for the steps prior to user's first access based on the "start" attribute
         if self.user:
             self.user.access_patterns[str(app.id)] = self
-            self.user.making_requests[str(app.id)] = {}
-            for step in range(1, start):
-                self.user.making_requests[str(app.id)][str(step)] = False
+            self.user.making_requests[str(app.id)] = {str(step): False for step in range(1, start)}
             self.user.making_requests[str(app.id)][str(start)] = True
 
             # Generating the initial user request
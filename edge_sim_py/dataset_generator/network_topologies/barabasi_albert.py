@@ -9,6 +9,7 @@ from ...components.network_link import NetworkLink
 
 # Python libraries
 import random
+from itertools import islice
 import networkx as nx
 
 
@@ -52,10 +53,9 @@ def barabasi_albert(network_nodes: list, link_specifications: list = [], min_lin
         topology._adj[link[1]][link[0]] = link_object
 
     # Applying the user-specified attributes to the network links
-    links = (link for link in random.sample(NetworkLink.all(), NetworkLink.count()))
+    links = iter(random.sample(NetworkLink.all(), NetworkLink.count()))
     for spec in link_specifications:
-        for _ in range(spec["number_of_objects"]):
-            link = next(links)
+        for link in islice(links, spec["number_of_objects"]):
             for key, value in spec.items():
                 if key != "number_of_objects":
                     link[key] = value
@@ -10,6 +10,10 @@ from ...components.network_link import NetworkLink
 
 # Python libraries
 import random
+from itertools import islice
+
+# Offsets between a position on the hexagonal grid and each of its six adjacent positions
+HEXAGONAL_GRID_NEIGHBOR_OFFSETS = ((-2, 0), (-1, 1), (1, 1), (2, 0), (1, -1), (-1, -1))
 
 
 def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications: list) -> Topology:
@@ -26,15 +30,16 @@ def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications:
     topology = Topology()
     topology.add_nodes_from(network_nodes)
 
-    # Gathering the list of coordinates of all network nodes
-    map_coordinates = [node.coordinates for node in network_nodes]
+    # Indexing network nodes by their coordinates
+    nodes_by_coordinates = {tuple(node.coordinates): node for node in network_nodes}
+    map_coordinates = set(nodes_by_coordinates)
 
     # Adding links to each network node
     for node in network_nodes:
         neighbors = find_neighbors_hexagonal_grid(current_position=node.coordinates, map_coordinates=map_coordinates)
 
         for neighbor_coordinates in neighbors:
-            neighbor = next((n for n in network_nodes if n.coordinates == neighbor_coordinates), None)
+            neighbor = nodes_by_coordinates.get(neighbor_coordinates)
 
             if not neighbor:
                 raise Exception(f"Cannot find network node with coordinates: {neighbor_coordinates}")
@@ -60,10 +65,9 @@ def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications:
         )
 
     # Applying the user-specified attributes to the network links
-    links = (link for link in random.sample(NetworkLink.all(), NetworkLink.count()))
+    links = iter(random.sample(NetworkLink.all(), NetworkLink.count()))
     for spec in link_specifications:
-        for _ in range(spec["number_of_objects"]):
-            link = next(links)
+        for link in islice(links, spec["number_of_objects"]):
             for key, value in spec.items():
                 if key != "number_of_objects":
                     link[key] = value
@@ -75,7 +79,7 @@ def find_neighbors_hexagonal_grid(map_coordinates: list, current_position: tuple
     """Finds the set of adjacent positions of coordinates 'current_position' on a hexagonal grid.
 
     Args:
-        map_coordinates (list): List of map coordinates.
+        map_coordinates (set): Set of map coordinates (lists are also accepted, at the cost of slower lookups).
         current_position (tuple): Current position on the map.
 
     Returns:
@@ -84,12 +88,10 @@ def find_neighbors_hexagonal_grid(map_coordinates: list, current_position: tuple
     x = current_position[0]
     y = current_position[1]
 
-    candidates = [(x - 2, y), (x - 1, y + 1), (x + 1, y + 1), (x + 2, y), (x + 1, y - 1), (x - 1, y - 1)]
-
     neighbors = [
-        neighbor
-        for neighbor in candidates
-        if neighbor[0] >= 0 and neighbor[1] >= 0 and (neighbor[0], neighbor[1]) in map_coordinates
+        (x + dx, y + dy)
+        for dx, dy in HEXAGONAL_GRID_NEIGHBOR_OFFSETS
+        if x + dx >= 0 and y + dy >= 0 and (x + dx, y + dy) in map_coordinates
     ]
 
     return neighbors
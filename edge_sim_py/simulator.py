@@ -17,7 +17,7 @@ from .component_manager import ComponentManager
 # we import all the components here so that they are present in globals() symbol table
 # the explicit ones are actually used
 from .components import *  # noqa F403
-from .components import NetworkLink, Topology, max_min_fairness
+from .components import BaseStation, NetworkLink, NetworkSwitch, PointOfInterest, Topology, max_min_fairness
 
 SUPPORTED_TIME_UNITS = ["seconds", "microseconds", "milliseconds", "minutes"]
 
@@ -136,6 +136,16 @@ class Simulator(ComponentManager, Model):
                 component_class._object_count = 0
                 component_class._instances = []
 
+        # Resetting component lookup indexes
+        BaseStation._by_coords = {}
+        NetworkSwitch._by_id = {}
+        PointOfInterest._instances_in_peak = {}
+        PointOfInterest._all_in_peak_cache = None
+        PointOfInterest._peak_bounds = None
+        PointOfInterest._peak_instances = None
+        PointOfInterest._last_step = None
+        PointOfInterest._coords_matrix = None
+
         # Declaring an empty variable that will receive the dataset metadata (if user passes valid information)
         data = None
 
@@ -255,6 +265,15 @@ class Simulator(ComponentManager, Model):
             topology._adj[link.nodes[0]][link.nodes[1]] = link
             topology._adj[link.nodes[1]][link.nodes[0]] = link
 
+        # Counting the communication paths of each application that pass through each network link
+        for user in User.all():
+            for app in user.applications:
+                communication_path = [
+                    [NetworkSwitch.find_by_id(switch_id) for switch_id in path]
+                    for path in user.communication_paths.get(app._id_str, [])
+                ]
+                topology._allocate_communication_path(communication_path=communication_path, app=app)
+
     def run_model(self):
         """Executes the simulation."""
         if self.stopping_criterion == None:
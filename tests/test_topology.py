@@ -0,0 +1,44 @@
+"""Contains tests for topology-related functionality."""
+
+# Python libraries
+import networkx as nx
+import pytest
+
+# EdgeSimPy components
+from edge_sim_py.components import NetworkLink, NetworkSwitch, Topology
+
+
+def create_topology(links: list) -> tuple:
+    topology = Topology()
+    switches = [NetworkSwitch() for _ in range(max(max(a, b) for a, b, _ in links) + 1)]
+
+    for a, b, delay in links:
+        add_link(topology=topology, switch_a=switches[a], switch_b=switches[b], delay=delay)
+
+    return topology, switches
+
+
+def add_link(topology: Topology, switch_a: NetworkSwitch, switch_b: NetworkSwitch, delay: int):
+    link = NetworkLink()
+    link["delay"] = delay
+    link["nodes"] = [switch_a, switch_b]
+    topology.add_edge(switch_a, switch_b)
+    topology._adj[switch_a][switch_b] = link
+    topology._adj[switch_b][switch_a] = link
+
+
+@pytest.mark.parametrize("get_path", [Topology._get_shortest_path, Topology._get_lowest_delay_path])
+def test_paths_follow_removed_and_added_links(get_path):
+    topology, switches = create_topology(links=[(0, 1, 1), (1, 3, 1), (0, 2, 5), (2, 3, 5)])
+
+    assert get_path(topology, switches[0], switches[3]) == [switches[0], switches[1], switches[3]]
+
+    topology.remove_edge(switches[1], switches[3])
+    assert get_path(topology, switches[0], switches[3]) == [switches[0], switches[2], switches[3]]
+
+    topology.remove_edge(switches[2], switches[3])
+    with pytest.raises(nx.NetworkXNoPath):
+        get_path(topology, switches[0], switches[3])
+
+    add_link(topology=topology, switch_a=switches[0], switch_b=switches[3], delay=1)
+    assert get_path(topology, switches[0], switches[3]) == [switches[0], switches[3]]
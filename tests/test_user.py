@@ -0,0 +1,84 @@
+"""Contains tests for user-related functionality."""
+
+# Python libraries
+import copy
+import json
+import pickle
+
+import pytest
+
+# EdgeSimPy components
+from edge_sim_py.components import User
+from edge_sim_py.components.mobility_models import point_of_interest_mobility
+from edge_sim_py.components.request_flags import RequestFlags
+
+
+def create_user(parameters: dict) -> User:
+    user = User()
+    user.mobility_model = point_of_interest_mobility
+    user.mobility_model_parameters = parameters
+    return user
+
+
+def test_deepcopy_user_keeps_mobility_model_parameters_bound_to_the_copy():
+    user = create_user(parameters={"n_moves": 3, "seconds_to_move": 30})
+
+    user_copy = copy.deepcopy(user)
+
+    assert user_copy.mobility_model_parameters == {"n_moves": 3, "seconds_to_move": 30}
+    assert user_copy.mobility_model_parameters is not user.mobility_model_parameters
+    assert user_copy._n_moves == 3 and user_copy._seconds_to_move == 30
+
+    user_copy.mobility_model_parameters["n_moves"] = 1
+
+    assert user_copy._n_moves == 1
+    assert user._n_moves == 3
+    assert user.mobility_model_parameters["n_moves"] == 3
+
+
+def test_deepcopy_mobility_model_parameters_does_not_copy_the_user():
+    user = create_user(parameters={"n_moves": 2, "path": [1, 2]})
+    number_of_users = User.count()
+
+    parameters = copy.deepcopy(user.mobility_model_parameters)
+
+    assert parameters == {"n_moves": 2, "path": [1, 2]}
+    assert parameters["path"] is not user.mobility_model_parameters["path"]
+    assert User.count() == number_of_users
+
+    parameters["n_moves"] = 5
+
+    assert user._n_moves == 2
+
+
+def test_pickle_user_keeps_mobility_model_parameters():
+    user = create_user(parameters={"n_moves": 4})
+    user.model = None
+
+    user_copy = pickle.loads(pickle.dumps(user))
+
+    assert user_copy.mobility_model_parameters == {"n_moves": 4}
+    assert user_copy._n_moves == 4
+
+    user_copy.mobility_model_parameters["n_moves"] = 1
+
+    assert user_copy._n_moves == 1
+
+
+def test_making_requests_is_json_serializable():
+    user = User()
+    user.making_requests["1"] = {"1": False}
+    user.making_requests["1"]["2"] = True
+
+    assert json.loads(json.dumps(user.making_requests)) == {"1": {"1": False, "2": True}}
+
+    exported_flags = user._to_dict()["attributes"]["making_requests"]
+    assert type(exported_flags) is dict and type(exported_flags["1"]) is dict
+
+
+def test_making_requests_raises_key_error_for_steps_without_flags():
+    user = User()
+    user.making_requests["1"] = {"1": True}
+
+    with pytest.raises(KeyError):
+        user.making_requests["1"][RequestFlags.step_key(2)]